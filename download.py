@@ -1,6 +1,10 @@
 from yt_dlp import YoutubeDL
 import os
 import re
+import copy
+import shutil
+import shelve
+import time
 import sys
 import kivy
 from kivy.app import App
@@ -10,24 +14,120 @@ from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.spinner import Spinner
 from kivy.uix.checkbox import CheckBox
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.progressbar import ProgressBar
 from kivy.clock import Clock
 from kivy.uix.popup import Popup
 from kivy.uix.filechooser import FileChooserListView
 import threading
-import os
+import asyncio
+import queue
+from collections import Counter, deque
 from typing import Optional, List, Dict, Tuple
-from urllib.parse import urlparse, parse_qs
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
-
-
-@lru_cache(maxsize=128)
+from cachetools import LRUCache, TTLCache, cached
+import logging
+
+try:
+    # Optional: google-re2 gives linear-time DFA matching for large URL pastes
+    import re2 as _url_re
+except ImportError:
+    _url_re = re
+
+
+class _LogFormatter(logging.Formatter):
+    """Plain messages, with warnings marked as such."""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno == logging.WARNING:
+            return f"Warning: {message}"
+        return message
+
+
+logger = logging.getLogger('y2belike')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Console output for CLI and library use (pythonw, used by the GUI launcher, has no stdout)
+if sys.stdout is not None:
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setFormatter(_LogFormatter())
+    logger.addHandler(_console_handler)
+
+# yt-dlp reports regular output through logger.debug, so let it through
+_ydl_logger = logging.getLogger('y2belike.yt_dlp')
+_ydl_logger.setLevel(logging.DEBUG)
+
+# URL patterns used to classify YouTube links without a network round trip
+_CHANNEL_RE = re.compile(r'/(@|channel/|c/|user/)')
+_PLAYLIST_RE = re.compile(r'[?&]list=')
+
+# URL separators (comma or any whitespace) and basic YouTube URL validation
+_SPLIT_RE = re.compile(r'[,\s]+')
+_VALID_RE = _url_re.compile(
+    r'^(https?://)?(www\.|m\.|music\.)?(youtube\.com/(watch\?|playlist\?|@|channel/|c/|user/)|youtu\.be/)')
+
+# URL info cache bounded by size and age so long GUI sessions don't hold stale data
+_url_info_cache = TTLCache(maxsize=256, ttl=600)
+_url_info_lock = threading.Lock()
+
+# Completed single-video downloads: (url, audio_only, quality) -> [(path, size)], persisted per
+# output directory. Playlist and channel entries use yt-dlp's download archive instead, so new
+# entries are still picked up when the same URL is submitted again.
+_DOWNLOAD_CACHE_FILE = '.download_cache'
+_DOWNLOAD_ARCHIVE_FILE = '.download_archive-{mode}-{quality}.txt'
+_download_cache = LRUCache(maxsize=256)
+_download_cache_lock = threading.Lock()
+
+# Output path components and detection messages per content type ({ext}/{kind} filled per download)
+_OUTTMPL_BY_TYPE = {
+    'playlist': ('%(playlist_title)s', '%(playlist_index)s-%(title)s.{ext}'),
+    'channel': ('%(uploader)s', '%(upload_date)s-%(title)s.{ext}'),
+    'video': ('%(title)s.{ext}',),
+}
+_DETECTED_MESSAGE_BY_TYPE = {
+    'playlist': "Detected playlist URL. Downloading entire playlist...",
+    'channel': "Detected channel URL. Downloading entire channel...",
+    'video': "Detected single video URL. Downloading {kind}...",
+}
+
+# YoutubeDL instances are not thread-safe, so each worker thread keeps its own small pool
+_YDL_POOL_SIZE = 4
+_ydl_local = threading.local()
+
+# Shared across all downloads so worker threads (and their pooled YoutubeDL instances) are reused
+MAX_DOWNLOAD_WORKERS = 16
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS, thread_name_prefix='download')
+
+# Aggregate throughput in bytes/sec (bytes transferred over each batch's wall time),
+# smoothed with an EWMA per worker count, used to size parallelism
+_THROUGHPUT_ALPHA = 0.3
+# A worker count only beats the one below it if it adds at least this fraction of one
+# worker's share of the lower count's throughput
+_SCALING_THRESHOLD = 0.5
+MIN_AUTO_WORKERS = 2
+_throughput_lock = threading.Lock()
+_batch_throughput: Dict[int, float] = {}
+
+
+# Flat extraction only lists playlist entries (IDs and titles), so it is cheap
+_FLAT_PROBE_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': 'in_playlist',
+}
+
+
+@cached(_url_info_cache, lock=_url_info_lock)
 def get_url_info(url: str) -> Tuple[str, Dict]:
     """
     Get URL information with caching to avoid duplicate yt-dlp calls.
-    Returns (content_type, info_dict) for efficient reuse.
+    The content type comes from the URL pattern; playlists and channels also get
+    a single flat extraction whose entries are reused by the download.
 
     Args:
         url (str): YouTube URL to analyze
@@ -35,63 +135,25 @@ def get_url_info(url: str) -> Tuple[str, Dict]:
     Returns:
         Tuple[str, Dict]: (content_type, info_dict) where content_type is 'video', 'playlist', or 'channel'
     """
-    try:
-        # Use yt-dlp to extract info without downloading
-        ydl_opts = {
-            'quiet': True,
-            'extract_flat': True,  # Only extract basic info, faster
-            'no_warnings': True,
-            'skip_download': True,
-            'playlist_items': '1',  # Only check first item for speed
-        }
+    if _CHANNEL_RE.search(url):
+        content_type = 'channel'
+    elif _PLAYLIST_RE.search(url):
+        content_type = 'playlist'
+    else:
+        return 'video', {}
 
-        with YoutubeDL(ydl_opts) as ydl:
+    try:
+        with YoutubeDL(_FLAT_PROBE_OPTS) as ydl:
             info = ydl.extract_info(url, download=False)
-
-            # Check if info extraction was successful
-            if info is None:
-                # Fallback to URL parsing if yt-dlp fails
-                parsed_url = urlparse(url)
-                query_params = parse_qs(parsed_url.query)
-
-                # Check for channel patterns
-                if '/@' in url or '/channel/' in url or '/c/' in url or '/user/' in url:
-                    return 'channel', {}
-                elif 'list' in query_params:
-                    return 'playlist', {}
-                else:
-                    return 'video', {}
-
-            # Determine content type based on yt-dlp info
-            content_type = info.get('_type', 'video')
-
-            # Handle channel detection
-            if content_type == 'playlist':
-                # Check if it's actually a channel (uploader_id indicates channel content)
-                if info.get('uploader_id') and ('/@' in url or '/channel/' in url or '/c/' in url or '/user/' in url):
-                    return 'channel', info
-                else:
-                    return 'playlist', info
-
-            return content_type, info
-
     except Exception:
-        # Simple fallback: check URL patterns
-        parsed_url = urlparse(url)
-        query_params = parse_qs(parsed_url.query)
-
-        if '/@' in url or '/channel/' in url or '/c/' in url or '/user/' in url:
-            return 'channel', {}
-        elif 'list' in query_params:
-            return 'playlist', {}
-        else:
-            return 'video', {}
+        info = None
+
+    return content_type, info or {}
 
 
 def is_playlist_url(url: str) -> bool:
     """
     Check if the provided URL is a playlist or a single video using cached detection.
-    Uses yt-dlp's native detection with simple URL parsing fallback.
 
     Args:
         url (str): YouTube URL to check
@@ -128,31 +190,22 @@ def parse_multiple_urls(input_string: str) -> List[str]:
     Returns:
         List[str]: List of cleaned URLs
     """
-    # Use regex to split by multiple separators: comma, space, newline, tab
-    urls = re.split(r'[,\s\n\t]+', input_string.strip())
-    urls = [url.strip() for url in urls if url.strip()]
+    # Split by multiple separators: comma, space, newline, tab
+    urls = [url for url in _SPLIT_RE.split(input_string.strip()) if url]
 
     # Validate URLs (basic YouTube URL check)
     valid_urls = []
     invalid_count = 0
     for url in urls:
-        if ('youtube.com' in url or 'youtu.be' in url) and (
-            '/watch?' in url or
-            '/playlist?' in url or
-            '/@' in url or
-            '/channel/' in url or
-            '/c/' in url or
-            '/user/' in url or
-            'youtu.be/' in url
-        ):
+        if _VALID_RE.match(url):
             valid_urls.append(url)
-        elif url:  # Only show warning for non-empty strings
-            print(f"Warning: Skipping invalid URL: {url}")
+        else:
+            logger.warning(f"Skipping invalid URL: {url}")
             invalid_count += 1
 
     if invalid_count > 0:
-        print(
-            f"Info: Found {len(valid_urls)} valid YouTube URLs, skipped {invalid_count} invalid entries")
+        logger.info(
+            f"Found {len(valid_urls)} valid YouTube URLs, skipped {invalid_count} invalid entries")
 
     return valid_urls
 
@@ -173,10 +226,215 @@ def get_available_formats(url: str) -> None:
         with YoutubeDL(ydl_opts) as ydl:
             ydl.extract_info(url, download=False)
     except Exception as e:
-        print(f"Error listing formats: {str(e)}")
+        logger.error(f"Error listing formats: {str(e)}")
+
+
+class _PooledYdl:
+    """A pooled YoutubeDL plus what its hooks observed during the current download."""
+
+    def __init__(self, ydl_opts: Dict):
+        self.finished_files = []
+        self.transferred_bytes = 0
+        self.ydl = YoutubeDL({
+            **ydl_opts,
+            'post_hooks': [self.finished_files.append],
+            'progress_hooks': [self._on_progress],
+        })
+
+    def _on_progress(self, status: Dict) -> None:
+        # Files yt-dlp finds already on disk report 'finished' without downloaded_bytes,
+        # so only real transfers are counted
+        if status.get('status') == 'finished' and status.get('downloaded_bytes'):
+            self.transferred_bytes += status['downloaded_bytes']
+
+    def reset(self) -> None:
+        self.finished_files.clear()
+        self.transferred_bytes = 0
+
+
+class _YdlPool(LRUCache):
+    """LRU of pooled YoutubeDL instances that closes the ones it evicts."""
+
+    def popitem(self):
+        key, entry = super().popitem()
+        entry.ydl.close()
+        return key, entry
+
+
+def _load_download_archive(path: str) -> set:
+    try:
+        with open(path, encoding='utf-8') as archive_file:
+            return {line.strip() for line in archive_file if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def _get_pooled_ydl(ydl_opts: Dict) -> _PooledYdl:
+    """
+    Get a YoutubeDL for these options, reused across calls on the current thread so
+    its HTTP connections stay open between downloads. The output template is set on
+    checkout, so it is not part of the pool key.
+
+    Returns:
+        _PooledYdl: The instance with its per-download file list and transfer counters reset
+    """
+    pool = getattr(_ydl_local, 'pool', None)
+    if pool is None:
+        pool = _ydl_local.pool = _YdlPool(maxsize=_YDL_POOL_SIZE)
+
+    key = repr(sorted((k, v) for k, v in ydl_opts.items() if k != 'outtmpl'))
+    entry = pool.get(key)
+    if entry is None:
+        entry = pool[key] = _PooledYdl(ydl_opts)
+
+    # YoutubeDL normalizes outtmpl into a dict of templates; only the default one is ours
+    entry.ydl.params['outtmpl']['default'] = ydl_opts['outtmpl']
+    # YoutubeDL only reads the archive file when it is created; pick up entries recorded by
+    # other threads or earlier batches since then (or a deleted archive)
+    if ydl_opts.get('download_archive'):
+        entry.ydl.archive = _load_download_archive(ydl_opts['download_archive'])
+    entry.reset()
+    return entry
+
+
+def _ewma(previous: Optional[float], sample: float) -> float:
+    if previous is None:
+        return sample
+    return previous + _THROUGHPUT_ALPHA * (sample - previous)
+
+
+def _record_batch_bandwidth(results: List[dict], workers: int, elapsed: float) -> None:
+    # Batches that ran a single download say nothing about how parallelism scales
+    num_bytes = sum(r.get('downloaded_bytes', 0) for r in results)
+    if workers < MIN_AUTO_WORKERS or num_bytes <= 0 or elapsed <= 0:
+        return
+    with _throughput_lock:
+        _batch_throughput[workers] = _ewma(_batch_throughput.get(workers), num_bytes / elapsed)
+
+
+def _beats_one_fewer(throughput: Dict[int, float], workers: int) -> bool:
+    fewer = throughput[workers - 1]
+    return throughput[workers] > fewer * (1 + _SCALING_THRESHOLD / (workers - 1))
+
+
+def pick_worker_count(url_count: int, default: int = 3) -> int:
+    """
+    Choose how many downloads to run at once by hill-climbing on the aggregate
+    throughput measured for each worker count. Starting from the best count seen, step
+    down while one worker fewer did as well, then try one more (or, failing that, one
+    fewer) if that count has not been measured yet. Downloads are network-bound, so
+    CPU count plays no part.
+
+    Args:
+        url_count (int): Number of URLs in the batch
+        default (int): Worker count to use before any throughput has been measured
+
+    Returns:
+        int: Worker count between 1 and MAX_DOWNLOAD_WORKERS
+    """
+    with _throughput_lock:
+        throughput = dict(_batch_throughput)
+
+    if throughput:
+        workers = max(throughput, key=throughput.get)
+        while workers - 1 in throughput and not _beats_one_fewer(throughput, workers):
+            workers -= 1
+        if workers + 1 not in throughput and workers < MAX_DOWNLOAD_WORKERS:
+            workers += 1
+        elif workers - 1 not in throughput and workers > MIN_AUTO_WORKERS:
+            workers -= 1
+    else:
+        workers = default
 
+    return max(1, min(workers, url_count))
 
-def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_only: bool = False, quality: str = "best") -> dict:
+
+async def _download_with_slot(semaphore: asyncio.Semaphore, *args) -> dict:
+    # Take the slot before handing the job to the pool, so waiting jobs hold no pool thread
+    async with semaphore:
+        result = await asyncio.get_running_loop().run_in_executor(_DOWNLOAD_POOL, download_single_video, *args)
+    logger.info(result['message'])
+    return result
+
+
+async def _download_batch(urls: List[str], output_path: str, max_workers: int, audio_only: bool,
+                          quality: str) -> List[dict]:
+    """
+    Download URLs on the shared download pool, at most max_workers at a time. Each
+    download starts as soon as its URL's info is ready, while later URLs are still probed.
+
+    Returns:
+        List[dict]: download_single_video results in completion order
+    """
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(max_workers)
+    info_queue = prefetch_url_info(urls)
+    types = []
+    tasks = []
+    while True:
+        item = await loop.run_in_executor(None, info_queue.get)
+        if item is None:
+            break
+        i, url, url_info = item
+        types.append(url_info)
+        content_type, cached_info = url_info
+        tasks.append(asyncio.ensure_future(_download_with_slot(
+            semaphore, url, output_path, i+1, audio_only, quality, content_type, cached_info)))
+
+    # Show what types of content we're downloading
+    _log_content_summary(types)
+
+    results = []
+    for task in asyncio.as_completed(tasks):
+        results.append(await task)
+
+    _record_batch_bandwidth(results, min(max_workers, len(tasks)), time.monotonic() - started)
+    return results
+
+
+def _download_cache_key(url: str, audio_only: bool, quality: str) -> str:
+    # shelve keys must be strings
+    return repr((url, audio_only, quality))
+
+
+def _lookup_completed_download(output_path: str, key: str) -> Optional[List[Tuple[str, int]]]:
+    """
+    Return the files recorded for a previous download if they are all still on disk
+    with the recorded size, otherwise None.
+    """
+    try:
+        with _download_cache_lock:
+            files = _download_cache.get((output_path, key))
+            if files is None:
+                with shelve.open(os.path.join(output_path, _DOWNLOAD_CACHE_FILE)) as db:
+                    files = db.get(key)
+                if files is not None:
+                    _download_cache[(output_path, key)] = files
+    except Exception:
+        return None
+
+    if files and all(os.path.isfile(path) and os.path.getsize(path) == size for path, size in files):
+        return files
+    return None
+
+
+def _record_completed_download(output_path: str, key: str, paths: List[str]) -> None:
+    files = [(path, os.path.getsize(path)) for path in paths if os.path.isfile(path)]
+    if not files:
+        return
+
+    try:
+        with _download_cache_lock:
+            _download_cache[(output_path, key)] = files
+            with shelve.open(os.path.join(output_path, _DOWNLOAD_CACHE_FILE)) as db:
+                db[key] = files
+    except Exception:
+        pass
+
+
+def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_only: bool = False, quality: str = "best",
+                          content_type: Optional[str] = None, cached_info: Optional[Dict] = None) -> dict:
     """
     Download a single YouTube video, playlist, or channel.
 
@@ -185,6 +443,8 @@ def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_
         output_path (str): Directory to save the download
         thread_id (int): Thread identifier for logging
         audio_only (bool): If True, download audio only in MP3 format
+        content_type (str, optional): Pre-computed content type from get_url_info
+        cached_info (Dict, optional): Pre-computed info dict from get_url_info
 
     Returns:
         dict: Result status with success/failure info
@@ -206,7 +466,7 @@ def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_
             'preferredcodec': 'mp3',
             'preferredquality': audio_quality,
         }]
-        print(f"[Thread {thread_id}] Audio-only mode: Downloading MP3 at {audio_quality}kbps...")
+        logger.info(f"[Thread {thread_id}] Audio-only mode: Downloading MP3 at {audio_quality}kbps...")
     else:
         # Configure for video downloads
         quality_map = {
@@ -218,17 +478,20 @@ def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_
         }
         video_height = quality_map.get(quality, '1080')
         format_selector = (
-            # Prefer formats that already include audio at specified quality
+            # Prefer formats that already include audio at specified quality, in an mp4 container
+            f'best[height<={video_height}][ext=mp4]/'
             f'best[height<={video_height}]/'
             # Fallback to merging if needed
             f'bestvideo[height<={video_height}]+bestaudio/best'
         )
         file_extension = 'mp4'
+        # yt-dlp skips the convertor for files that are already mp4, so this only runs
+        # when a non-mp4 fallback format was selected
         postprocessors = [{
             'key': 'FFmpegVideoConvertor',
             'preferedformat': 'mp4',
         }]
-        print(f"[Thread {thread_id}] Video mode: Downloading MP4 at {quality}...")
+        logger.info(f"[Thread {thread_id}] Video mode: Downloading MP4 at {quality}...")
 
     # Configure yt-dlp options
     ydl_opts = {
@@ -246,82 +509,120 @@ def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_
         'clean_infojson': True,
         'retries': 3,
         'fragment_retries': 3,
+        # Fetch DASH/HLS fragments in parallel instead of one at a time
+        'concurrent_fragment_downloads': 8,
         # Ensure playlists are fully downloaded
         'noplaylist': False,  # Allow playlist downloads
+        'logger': _ydl_logger,
+        # Progress ticks arrive several times a second per stream; keep only
+        # yt-dlp's one-line "Download completed" notice per file
+        'noprogress': True,
     }
 
+    # Hand transfers to aria2c when installed for multi-connection downloads
+    if shutil.which('aria2c'):
+        ydl_opts['external_downloader'] = 'aria2c'
+        ydl_opts['external_downloader_args'] = {'aria2c': ['-x', '16', '-s', '16', '-k', '1M']}
+
     # Add merge format for video downloads only
     if not audio_only:
         ydl_opts['merge_output_format'] = 'mp4'
 
     # Set different output templates for playlists, channels and single videos
-    content_type, cached_info = get_url_info(url)
+    if content_type is None:
+        content_type, cached_info = get_url_info(url)
+    cached_info = cached_info or {}
 
     # Debug: Print detection result
-    if thread_id == 1:  # Only print for first thread to avoid spam
-        print(f"[Debug] URL analysis: {content_type.title()}")
-
-    if content_type == 'playlist':
-        ydl_opts['outtmpl'] = os.path.join(
-            output_path, '%(playlist_title)s', f'%(playlist_index)s-%(title)s.{file_extension}')
-        print(
-            f"[Thread {thread_id}] Detected playlist URL. Downloading entire playlist...")
-    elif content_type == 'channel':
-        ydl_opts['outtmpl'] = os.path.join(
-            output_path, '%(uploader)s', f'%(upload_date)s-%(title)s.{file_extension}')
-        print(
-            f"[Thread {thread_id}] Detected channel URL. Downloading entire channel...")
-    else:  # single video
-        ydl_opts['outtmpl'] = os.path.join(
-            output_path, f'%(title)s.{file_extension}')
-        print(
-            f"[Thread {thread_id}] Detected single video URL. Downloading {'audio' if audio_only else 'video'}...")
+    if thread_id == 1:  # Only log for first thread to avoid spam
+        logger.info(f"[Debug] URL analysis: {content_type.title()}")
+
+    if content_type not in _OUTTMPL_BY_TYPE:
+        content_type = 'video'
+
+    if content_type == 'video':
+        # Skip single videos that already completed with the same settings
+        cache_key = _download_cache_key(url, audio_only, quality)
+        if _lookup_completed_download(output_path, cache_key):
+            return {
+                'url': url,
+                'success': True,
+                'message': f"[Thread {thread_id}] Already downloaded, skipping: {url}"
+            }
+    else:
+        # Remember finished playlist/channel entries per video, separately for each format and quality
+        ydl_opts['download_archive'] = os.path.join(output_path, _DOWNLOAD_ARCHIVE_FILE.format(
+            mode='audio' if audio_only else 'video', quality=quality))
 
-    try:
-        with YoutubeDL(ydl_opts) as ydl:
-            # Extract fresh info for download (cached info is only for detection)
-            info = ydl.extract_info(url, download=False)
+    ydl_opts['outtmpl'] = os.path.join(
+        output_path, *(part.format(ext=file_extension) for part in _OUTTMPL_BY_TYPE[content_type]))
+    logger.info(f"[Thread {thread_id}] " + _DETECTED_MESSAGE_BY_TYPE[content_type].format(
+        kind='audio' if audio_only else 'video'))
 
-            # Check if info extraction was successful
-            if info is None:
+    try:
+        # Pooled instance collects final file paths (after postprocessing) for the download cache
+        pooled = _get_pooled_ydl(ydl_opts)
+        ydl, finished_files = pooled.ydl, pooled.finished_files
+
+        if cached_info.get('_type') == 'playlist':
+            # Reuse the flat playlist listing instead of fetching the manifest again
+            title = cached_info.get('title', f'Unknown {content_type.title()}')
+            video_count = len(cached_info.get('entries') or [])
+            logger.info(
+                f"[Thread {thread_id}] {content_type.title()}: '{title}' ({video_count} videos)")
+
+            if video_count == 0:
                 return {
                     'url': url,
                     'success': False,
-                    'message': f"[Thread {thread_id}] Failed to extract video information. Video may be private or unavailable."
+                    'message': f"[Thread {thread_id}] {content_type.title()} appears to be empty or private"
                 }
 
-            if info.get('_type') == 'playlist':
-                title = info.get('title', 'Unknown Playlist')
-                video_count = len(info.get('entries', []))
-                print(
-                    f"[Thread {thread_id}] {content_type.title()}: '{title}' ({video_count} videos)")
-
-                # Ensure we have entries to download
-                if video_count == 0:
-                    return {
-                        'url': url,
-                        'success': False,
-                        'message': f"[Thread {thread_id}] {content_type.title()} appears to be empty or private"
-                    }
-
-            # Download content
-            ydl.download([url])
-
-            if info.get('_type') == 'playlist':
-                title = info.get('title', f'Unknown {content_type.title()}')
-                video_count = len(info.get('entries', []))
-                return {
-                    'url': url,
-                    'success': True,
-                    'message': f"[Thread {thread_id}] {content_type.title()} '{title}' download completed! ({video_count} {'MP3s' if audio_only else 'videos'})"
-                }
-            else:
+            info = ydl.process_ie_result(copy.deepcopy(cached_info), download=True)
+        else:
+            # Extract and download in a single pass (download() would re-extract)
+            info = ydl.extract_info(url, download=True)
+
+        # Check if info extraction was successful
+        if info is None:
+            return {
+                'url': url,
+                'success': False,
+                'message': f"[Thread {thread_id}] Failed to extract video information. Video may be private or unavailable."
+            }
+
+        downloaded_bytes = pooled.transferred_bytes
+
+        if info.get('_type') == 'playlist':
+            title = info.get('title', f'Unknown {content_type.title()}')
+            # yt-dlp drops entries already in the download archive (and failed ones) from
+            # the processed result, so this counts what was actually downloaded this time
+            processed_count = len(info.get('entries') or [])
+
+            if processed_count == 0:
                 return {
                     'url': url,
                     'success': True,
-                    'message': f"[Thread {thread_id}] {'Audio' if audio_only else 'Video'} download completed successfully!"
+                    'downloaded_bytes': downloaded_bytes,
+                    'message': f"[Thread {thread_id}] {content_type.title()} '{title}' is up to date, nothing new to download"
                 }
 
+            return {
+                'url': url,
+                'success': True,
+                'downloaded_bytes': downloaded_bytes,
+                'message': f"[Thread {thread_id}] {content_type.title()} '{title}' download completed! ({processed_count} {'MP3s' if audio_only else 'videos'})"
+            }
+        else:
+            if content_type == 'video':
+                _record_completed_download(output_path, cache_key, finished_files)
+            return {
+                'url': url,
+                'success': True,
+                'downloaded_bytes': downloaded_bytes,
+                'message': f"[Thread {thread_id}] {'Audio' if audio_only else 'Video'} download completed successfully!"
+            }
+
     except Exception as e:
         return {
             'url': url,
@@ -330,8 +631,84 @@ def download_single_video(url: str, output_path: str, thread_id: int = 0, audio_
         }
 
 
+def prefetch_url_info(urls: List[str]) -> queue.Queue:
+    """
+    Start probing URLs on a background thread so downloads can begin while
+    the remaining URLs are still being analyzed.
+
+    Args:
+        urls (List[str]): List of YouTube URLs to analyze
+
+    Returns:
+        queue.Queue: Yields (index, url, (content_type, info_dict)) as each probe
+        finishes, in completion order, followed by None once every URL has been probed
+    """
+    info_queue = queue.Queue()
+
+    def prefetch():
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(urls), 8))) as probe_executor:
+                future_to_index = {probe_executor.submit(get_url_info, url): i for i, url in enumerate(urls)}
+                # A slow probe (e.g. a large channel listing) must not hold back the URLs after it
+                for future in as_completed(future_to_index):
+                    i = future_to_index[future]
+                    info_queue.put((i, urls[i], future.result()))
+        finally:
+            info_queue.put(None)
+
+    threading.Thread(target=prefetch, daemon=True).start()
+    return info_queue
+
+
+def _log_download_header(urls: List[str], output_path: str, max_workers: int, audio_only: bool) -> None:
+    logger.info(
+        f"\nStarting download of {len(urls)} URL(s) with {max_workers} concurrent workers...")
+    logger.info(f"Output directory: {output_path}")
+    logger.info(f"Format: {'MP3 Audio Only' if audio_only else 'MP4 Video'}")
+
+
+def _log_content_summary(types: List[Tuple[str, Dict]]) -> None:
+    counts = Counter(content_type for content_type, _ in types)
+
+    content_summary = []
+    if counts['playlist'] > 0:
+        content_summary.append(f"{counts['playlist']} playlist(s)")
+    if counts['channel'] > 0:
+        content_summary.append(f"{counts['channel']} channel(s)")
+    if counts['video'] > 0:
+        content_summary.append(f"{counts['video']} video(s)")
+
+    if content_summary:
+        logger.info(f"Content: {' + '.join(content_summary)}")
+    else:
+        logger.info("Content: Unknown content type")
+
+    logger.info("-" * 60)
+
+
+def _log_download_summary(results: List[dict], output_path: str) -> None:
+    logger.info("\n" + "=" * 60)
+    logger.info("DOWNLOAD SUMMARY")
+    logger.info("=" * 60)
+
+    successful = [r for r in results if r['success']]
+    failed = [r for r in results if not r['success']]
+
+    logger.info(f"Successful downloads: {len(successful)}")
+    logger.info(f"Failed downloads: {len(failed)}")
+
+    if failed:
+        logger.info("\nFailed URLs:")
+        for result in failed:
+            logger.info(f"   • {result['url']}")
+            logger.info(f"     Reason: {result['message']}")
+
+    if successful:
+        logger.info(f"\nAll files saved to: {output_path}")
+
+
 def download_youtube_content(urls: List[str], output_path: Optional[str] = None,
-                              list_formats: bool = False, max_workers: int = 3, audio_only: bool = False, quality: str = "best") -> None:
+                              list_formats: bool = False, max_workers: Optional[int] = None, audio_only: bool = False, quality: str = "best") -> None:
     """
     Download YouTube content (single videos, playlists, or channels) in MP4 format or MP3 audio only.
     Supports multiple URLs for simultaneous downloading.
@@ -340,7 +717,7 @@ def download_youtube_content(urls: List[str], output_path: Optional[str] = None,
         urls (List[str]): List of YouTube URLs to download (videos, playlists, or channels)
         output_path (str, optional): Directory to save the downloads. Defaults to './downloads'
         list_formats (bool): If True, only list available formats without downloading
-        max_workers (int): Maximum number of concurrent downloads
+        max_workers (int, optional): Maximum number of concurrent downloads. Defaults to pick_worker_count()
         audio_only (bool): If True, download audio only in MP3 format
     """
     # Set default output path if none provided
@@ -349,75 +726,74 @@ def download_youtube_content(urls: List[str], output_path: Optional[str] = None,
 
     # If user wants to list formats, do that for the first URL and return
     if list_formats:
-        print("Available formats for the first provided URL:")
+        logger.info("Available formats for the first provided URL:")
         get_available_formats(urls[0])
         return
 
     # Create output directory if it doesn't exist
     os.makedirs(output_path, exist_ok=True)
 
-    print(
-        f"\nStarting download of {len(urls)} URL(s) with {max_workers} concurrent workers...")
-    print(f"Output directory: {output_path}")
-    print(f"Format: {'MP3 Audio Only' if audio_only else 'MP4 Video'}")
+    if max_workers is None:
+        max_workers = pick_worker_count(len(urls))
+    _log_download_header(urls, output_path, max_workers, audio_only)
 
-    # Show what types of content we're downloading
-    playlist_count = sum(
-        1 for url in urls if get_content_type(url) == 'playlist')
-    channel_count = sum(
-        1 for url in urls if get_content_type(url) == 'channel')
-    video_count = len(urls) - playlist_count - channel_count
+    results = asyncio.run(_download_batch(urls, output_path, max_workers, audio_only, quality))
+    _log_download_summary(results, output_path)
 
-    content_summary = []
-    if playlist_count > 0:
-        content_summary.append(f"{playlist_count} playlist(s)")
-    if channel_count > 0:
-        content_summary.append(f"{channel_count} channel(s)")
-    if video_count > 0:
-        content_summary.append(f"{video_count} video(s)")
 
-    if content_summary:
-        print(f"Content: {' + '.join(content_summary)}")
-    else:
-        print("Content: Unknown content type")
+class LogBufferHandler(logging.Handler):
+    """Forwards log records to a thread-safe log callback such as the GUI's batched log."""
 
-    print("-" * 60)
+    def __init__(self, log_message):
+        super().__init__()
+        self._log_message = log_message
+        self.setFormatter(_LogFormatter())
 
-    # Concurrent downloads
-    results = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {
-            executor.submit(download_single_video, url, output_path, i+1, audio_only, quality): url
-            for i, url in enumerate(urls)
-        }
-
-        # Collect results
-        for future in as_completed(future_to_url):
-            result = future.result()
-            results.append(result)
-            print(result['message'])
+    def emit(self, record):
+        try:
+            self._log_message(self.format(record))
+        except Exception:
+            self.handleError(record)
 
-    print("\n" + "=" * 60)
-    print("DOWNLOAD SUMMARY")
-    print("=" * 60)
 
-    successful = [r for r in results if r['success']]
-    failed = [r for r in results if not r['success']]
+class LogRow(RecycleDataViewBehavior, Label):
+    """Single left-aligned log entry that wraps and grows to fit its text."""
 
-    print(f"Successful downloads: {len(successful)}")
-    print(f"Failed downloads: {len(failed)}")
+    MIN_HEIGHT = 22
 
-    if failed:
-        print("\nFailed URLs:")
-        for result in failed:
-            print(f"   • {result['url']}")
-            print(f"     Reason: {result['message']}")
-
-    if successful:
-        print(f"\nAll files saved to: {output_path}")
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.halign = 'left'
+        self.valign = 'middle'
+        self._rv = None
+        self._index = None
+        self.bind(width=self._update_text_size, texture_size=self._update_height)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self._rv = rv
+        self._index = index
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _update_text_size(self, instance, width):
+        # Wrap at the row width and let the height follow the rendered text
+        self.text_size = (width, None)
+
+    def _update_height(self, instance, texture_size):
+        if self._rv is None or self._index >= len(self._rv.data):
+            return
+        # The layout sizes rows from their data, so store the height there
+        height = max(texture_size[1], self.MIN_HEIGHT)
+        row = self._rv.data[self._index]
+        if row.get('height') != height:
+            row['height'] = height
+            self._rv.refresh_from_data(modified=slice(self._index, self._index + 1))
 
 
 class YouTubeDownloaderGUI(BoxLayout):
+    LOG_FLUSH_INTERVAL = 0.1
+    LOG_BUFFER_SIZE = 1000
+    LOG_MAX_ROWS = 500
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
@@ -492,7 +868,7 @@ class YouTubeDownloaderGUI(BoxLayout):
 
         # Concurrent workers (automatic)
         self.add_widget(Label(
-            text="Descargas concurrentes: Automáticas (basado en cantidad de URLs)",
+            text="Descargas concurrentes: Automáticas (según cantidad de URLs y velocidad medida)",
             size_hint_y=None,
             height=30,
             font_size=12,
@@ -543,15 +919,32 @@ class YouTubeDownloaderGUI(BoxLayout):
 
         # Log area
         self.add_widget(Label(text="Registro de progreso:", size_hint_y=None, height=30))
-        scroll_view = ScrollView(size_hint_y=0.4)
-        self.log_text = TextInput(
-            readonly=True,
-            multiline=True,
-            size_hint=(1, None),
-            height=200
+        # RecycleView only lays out the visible rows, so appending stays cheap as the log grows
+        self._log_rows = deque(maxlen=self.LOG_MAX_ROWS)
+        self._log_color = (1, 1, 1, 1)
+        self.log_view = RecycleView(size_hint_y=0.4, viewclass=LogRow)
+        log_layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, LogRow.MIN_HEIGHT),
+            default_size_hint=(1, None)
         )
-        scroll_view.add_widget(self.log_text)
-        self.add_widget(scroll_view)
+        log_layout.bind(minimum_height=log_layout.setter('height'))
+        self.log_view.add_widget(log_layout)
+        self.add_widget(self.log_view)
+
+        # Event loop driving downloads, started on first use
+        self._loop = None
+
+        # Pending log lines, flushed to the widget at most every LOG_FLUSH_INTERVAL seconds
+        self._log_buffer = deque(maxlen=self.LOG_BUFFER_SIZE)
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+
+        # Route module and yt-dlp log records into the batched GUI log. Attached for the
+        # window's lifetime so URL parsing warnings before a download are shown too.
+        self._log_handler = LogBufferHandler(self.log_message)
+        logger.addHandler(self._log_handler)
 
     def on_format_change(self, checkbox, value):
         if value:
@@ -595,12 +988,36 @@ class YouTubeDownloaderGUI(BoxLayout):
                 widget.background_color = colors['secondary']
                 widget.foreground_color = colors['fg']
 
-    def log_message(self, message):
-        Clock.schedule_once(lambda dt: self._update_log(message))
+        # Log rows are recycled from their data, so recolor the data itself
+        self._log_color = colors['fg']
+        for row in self._log_rows:
+            row['color'] = self._log_color
+        self.log_view.data = list(self._log_rows)
 
-    def _update_log(self, message):
-        self.log_text.text += message + "\n"
-        self.log_text.cursor = (0, len(self.log_text.text.split('\n')))
+    def log_message(self, message):
+        # Safe to call from any thread; lines are coalesced into one widget update
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        Clock.schedule_once(self._flush_log, self.LOG_FLUSH_INTERVAL)
+
+    def _flush_log(self, dt):
+        with self._log_lock:
+            messages = list(self._log_buffer)
+            self._log_buffer.clear()
+            self._log_flush_scheduled = False
+        if messages:
+            self._update_log(messages)
+
+    def _update_log(self, messages):
+        for message in messages:
+            for line in message.split("\n"):
+                self._log_rows.append({'text': line, 'color': self._log_color})
+        self.log_view.data = list(self._log_rows)
+        # Keep the newest lines in view
+        self.log_view.scroll_y = 0
 
     def start_download(self, instance):
         urls_input = self.url_text.text.strip()
@@ -619,36 +1036,33 @@ class YouTubeDownloaderGUI(BoxLayout):
 
         audio_only = self.format_var == "audio"
         quality = self.quality_spinner.text
-        # Automatic workers based on URL count
-        max_workers = min(len(urls), 5)  # Max 5 workers, or number of URLs if less
-        if max_workers == 0:
-            max_workers = 1
+        # Automatic workers based on URL count and measured throughput
+        max_workers = pick_worker_count(len(urls))
 
         self.start_button.disabled = True
         self.progress.value = 0
         self.log_message(f"Iniciando descarga de {len(urls)} URL(s) con {max_workers} worker(s) automático(s)...")
 
-        # Run download in a separate thread
-        thread = threading.Thread(target=self.run_download, args=(urls, output_path, audio_only, max_workers, quality))
-        thread.start()
-
-    def run_download(self, urls, output_path, audio_only, max_workers, quality):
-        # Redirect print to log_message
-        import builtins
-        original_print = builtins.print
+        # Run download on the background event loop
+        asyncio.run_coroutine_threadsafe(
+            self._download_async(urls, output_path, audio_only, max_workers, quality), self._get_loop())
 
-        def custom_print(*args, **kwargs):
-            message = " ".join(str(arg) for arg in args)
-            Clock.schedule_once(lambda dt: self._update_log(message))
-
-        builtins.print = custom_print
+    def _get_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self._loop
 
+    async def _download_async(self, urls, output_path, audio_only, max_workers, quality):
         try:
-            download_youtube_content(urls, output_path, max_workers=max_workers, audio_only=audio_only, quality=quality)
+            os.makedirs(output_path, exist_ok=True)
+            _log_download_header(urls, output_path, max_workers, audio_only)
+
+            results = await _download_batch(urls, output_path, max_workers, audio_only, quality)
+            _log_download_summary(results, output_path)
         except Exception as e:
-            Clock.schedule_once(lambda dt: self._update_log(f"Error: {str(e)}"))
+            self.log_message(f"Error: {str(e)}")
         finally:
-            builtins.print = original_print
             Clock.schedule_once(lambda dt: self.download_finished())
 
     def download_finished(self):